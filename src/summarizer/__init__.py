@@ -1,6 +1,23 @@
-from .extract import extract_text_for_summary
-from .pii import contains_pii, redact_pii
-from .summarize import PIIDetectedError, summarize_text, summarize_document
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .extract import extract_text_for_summary
+    from .pii import contains_pii, redact_pii
+    from .summarize import PIIDetectedError, summarize_text, summarize_document
+
+# Public names are imported from their submodule on first access (PEP 562), so
+# e.g. a caller that only needs contains_pii never imports the Bedrock code path.
+_EXPORTS = {
+    "contains_pii": ".pii",
+    "extract_text_for_summary": ".extract",
+    "redact_pii": ".pii",
+    "PIIDetectedError": ".summarize",
+    "summarize_text": ".summarize",
+    "summarize_document": ".summarize",
+}
 
 __all__ = [
     "contains_pii",
@@ -10,3 +27,16 @@ __all__ = [
     "summarize_text",
     "summarize_document",
 ]
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,68 @@
+"""
+Content-addressed cache for extracted text and summaries.
+
+Entries are JSON files named by a SHA-256 key built from the input content and
+every setting that affects the result, so a hit needs no AWS calls. Disabled
+unless DOCUMENT_SUMMARIZER_CACHE_DIR is set: cached text and summaries are
+document content, so the directory must be treated as sensitive (e.g. an
+encrypted, task-local volume).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional, Union
+
+CACHE_DIR_ENV = "DOCUMENT_SUMMARIZER_CACHE_DIR"
+
+
+def cache_key(*parts: Union[str, bytes]) -> str:
+    """SHA-256 hex digest over the given parts (NUL-separated so parts can't run together)."""
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(part.encode("utf-8") if isinstance(part, str) else part)
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+class ResultCache:
+    """Directory of JSON files keyed by cache_key(); writes are atomic."""
+
+    def __init__(self, directory: Union[str, Path]):
+        self._dir = Path(directory)
+
+    def _path(self, namespace: str, key: str) -> Path:
+        return self._dir / namespace / f"{key}.json"
+
+    def get(self, namespace: str, key: str) -> Optional[str]:
+        try:
+            with self._path(namespace, key).open("r", encoding="utf-8") as f:
+                return json.load(f)["value"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def put(self, namespace: str, key: str, value: str) -> None:
+        path = self._path(namespace, key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump({"value": value}, f)
+                os.replace(tmp, path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+        except OSError:
+            # Caching is best-effort; never fail a summarization because of it.
+            pass
+
+
+def get_default_cache() -> Optional[ResultCache]:
+    """Cache at $DOCUMENT_SUMMARIZER_CACHE_DIR, or None when caching is disabled."""
+    directory = os.environ.get(CACHE_DIR_ENV)
+    return ResultCache(directory) if directory else None
@@ -0,0 +1,44 @@
+"""
+Shared boto3 clients for Bedrock, Textract, Comprehend, and S3.
+
+Clients are created once per (service, region) and reused across calls, so a
+warm Lambda/ECS process pays the botocore model load and TLS setup only once.
+botocore clients are thread-safe, so the cached clients also back the
+concurrent Comprehend and Textract calls.
+"""
+
+from __future__ import annotations
+
+import threading
+from functools import lru_cache
+from typing import Optional
+
+# Comfortably above the largest thread-pool fan-out (Comprehend chunks in pii.py),
+# so concurrent callers sharing a client never wait on the connection pool.
+MAX_POOL_CONNECTIONS = 64
+
+# One session per process, created on first use so importing the package does not
+# load boto3; Session.client() itself is not thread-safe.
+_session = None
+_session_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def get_client(service: str, region_name: Optional[str] = None):
+    """Return the process-wide boto3 client for `service` in `region_name`."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            import boto3
+
+            _session = boto3.session.Session()
+        from botocore.config import Config
+
+        config = Config(
+            max_pool_connections=MAX_POOL_CONNECTIONS,
+            tcp_keepalive=True,
+            retries={"mode": "adaptive", "max_attempts": 5},
+            connect_timeout=3,
+            read_timeout=60,
+        )
+        return _session.client(service, region_name=region_name, config=config)
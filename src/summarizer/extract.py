@@ -1,42 +1,176 @@
 """
-Extract text from PDF (Amazon Textract) and Word (.docx) for summarization.
+Extract text from PDF (pypdf / Amazon Textract) and Word (.docx) for summarization.
 
-- PDF: Uses Amazon Textract (AWS). Single-page via sync API; multi-page via
-  async API (S3 only). When run in the VPC with the Terraform stack, Textract
-  is reached via VPC endpoint.
-- Word: Uses python-docx (runs in your Lambda/ECS). AWS has no managed
-  Word-to-text API.
+- PDF: Born-digital PDFs are read locally with pypdf. Scanned PDFs (no text
+  layer) fall back to Amazon Textract (AWS): single-page via sync API,
+  multi-page via async API (S3 only). When run in the VPC with the Terraform
+  stack, Textract is reached via VPC endpoint.
+- Word: Reads word/document.xml directly (runs in your Lambda/ECS), with
+  python-docx as fallback. AWS has no managed Word-to-text API.
 """
 
 from __future__ import annotations
 
+import hashlib
+import io
+import queue
 import re
+import threading
 import time
+import xml.etree.ElementTree as ET
+import zipfile
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
-import boto3
+from .cache import cache_key, get_default_cache
+from .clients import get_client
+
+_S3_URI_RE = re.compile(r"^s3://([^/]+)/(.+)$", re.IGNORECASE)
+
+
+def _is_s3_uri(source: str) -> bool:
+    """True for s3:// sources (any case), without lowercasing the whole string."""
+    return source[:5].lower() == "s3://"
+
+
+# Textract result pages fetched ahead of text conversion.
+_PAGE_PREFETCH = 4
+# How often a blocked prefetch thread re-checks whether the consumer stopped.
+_PAGE_PUT_TIMEOUT = 0.5
+_PAGES_DONE = object()
+
+# Local (pypdf) text shorter than this is treated as a scanned PDF -> Textract.
+_MIN_LOCAL_PDF_CHARS = 32
+# Only small S3 PDFs are downloaded and tried locally; larger ones go straight to
+# async Textract so scanned files don't pay a full download + parse first.
+_MAX_LOCAL_PDF_BYTES = 4 * 1024 * 1024
+# WordprocessingML namespace.
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+# Read size when hashing local files for the extraction cache key.
+_READ_CHUNK_BYTES = 64 * 1024
 
 
 def _textract_client(region_name: Optional[str] = None):
-    return boto3.client("textract", region_name=region_name)
+    return get_client("textract", region_name)
 
 
 def _blocks_to_text(blocks: list[dict]) -> str:
     """Convert Textract Block list to plain text (LINE blocks, in order)."""
-    lines = [
-        b["Text"]
-        for b in blocks
-        if b.get("BlockType") == "LINE" and b.get("Text")
-    ]
-    return "\n".join(lines)
+    return "\n".join(
+        b["Text"] for b in blocks if b.get("BlockType") == "LINE" and b.get("Text")
+    )
 
 
-def extract_text_from_pdf_bytes(pdf_bytes: bytes, *, region_name: Optional[str] = None) -> str:
+def _poll_delays(initial: float, maximum: float, timeout: float) -> Iterator[float]:
+    """Backoff delays between Textract status checks; stops once `timeout` seconds have passed."""
+    delay = initial
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        yield delay
+        delay = min(maximum, delay * 1.5)
+
+
+def _job_succeeded(result: dict, job_id: str) -> bool:
+    """True once a GetDocumentTextDetection result is SUCCEEDED; raises if the job FAILED."""
+    status = result["JobStatus"]
+    if status == "FAILED":
+        raise RuntimeError(
+            f"Textract job {job_id} failed: {result.get('StatusMessage', 'unknown')}"
+        )
+    return status == "SUCCEEDED"
+
+
+def _join_page_texts(page_texts: Iterable[str]) -> str:
+    return "\n".join(t for t in page_texts if t)
+
+
+def _iter_result_pages(client, job_id: str, first: dict) -> Iterator[list[dict]]:
+    """
+    Yield Block lists for a finished Textract job, starting with `first`.
+    NextToken pages are fetched on a background thread so the next request is
+    in flight while the caller converts the current page. If the caller stops
+    early (error or close), the thread notices and exits instead of blocking.
+    """
+    if not first.get("NextToken"):
+        yield first.get("Blocks", [])
+        return
+
+    pages: queue.Queue = queue.Queue(maxsize=_PAGE_PREFETCH)
+    stop = threading.Event()
+
+    def put(item) -> bool:
+        """Queue item for the consumer; False once the consumer has gone away."""
+        while not stop.is_set():
+            try:
+                pages.put(item, timeout=_PAGE_PUT_TIMEOUT)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        result = first
+        try:
+            while result.get("NextToken") and not stop.is_set():
+                result = client.get_document_text_detection(
+                    JobId=job_id, NextToken=result["NextToken"]
+                )
+                if not put(result.get("Blocks", [])):
+                    return
+        except Exception as e:
+            put(e)
+        finally:
+            put(_PAGES_DONE)
+
+    threading.Thread(target=produce, name=f"textract-{job_id}", daemon=True).start()
+    try:
+        yield first.get("Blocks", [])
+        while True:
+            item = pages.get()
+            if item is _PAGES_DONE:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stop.set()
+
+
+def _extract_text_local_pdf(pdf_bytes: bytes) -> str:
+    """
+    Extract the embedded text layer with pypdf. Returns "" when pypdf is not
+    installed, cannot read the file, or any page has no text (e.g. a typed cover
+    page on a scanned body), so callers fall back to Textract for the whole file.
+    """
+    try:
+        from pypdf import PdfReader
+
+        reader = PdfReader(io.BytesIO(pdf_bytes))
+        pages = []
+        for page in reader.pages:
+            page_text = page.extract_text() or ""
+            if not page_text.strip():
+                return ""
+            pages.append(page_text)
+        return "\n".join(pages)
+    except Exception:
+        return ""
+
+
+def extract_text_from_pdf_bytes(
+    pdf_bytes: bytes,
+    *,
+    region_name: Optional[str] = None,
+    min_local_chars: int = _MIN_LOCAL_PDF_CHARS,
+) -> str:
     """
-    Extract text from a single-page PDF using Textract (sync).
-    For multi-page PDFs, use extract_text_from_pdf_s3() with the file in S3.
+    Extract text from a PDF: locally via pypdf when every page has a text layer
+    (at least min_local_chars of text in total), otherwise Textract (sync, single-page).
+    For scanned multi-page PDFs, use extract_text_from_pdf_s3() with the file in S3.
     """
+    text = _extract_text_local_pdf(pdf_bytes)
+    if len(text.strip()) >= min_local_chars:
+        return text
     client = _textract_client(region_name=region_name)
     resp = client.detect_document_text(Document={"Bytes": pdf_bytes})
     return _blocks_to_text(resp.get("Blocks", []))
@@ -49,51 +183,145 @@ def extract_text_from_pdf_s3(
     region_name: Optional[str] = None,
     poll_interval: float = 2.0,
     poll_timeout: float = 300.0,
+    initial_poll_interval: float = 0.25,
+    min_local_chars: int = _MIN_LOCAL_PDF_CHARS,
+    content_length: Optional[int] = None,
 ) -> str:
     """
-    Extract text from a PDF in S3 using Textract (async). Supports multi-page.
-    Polls until the job completes (no SNS required).
+    Extract text from a PDF in S3. Supports multi-page.
+    Pass content_length (object size from HeadObject) if already known to skip
+    a second HeadObject call.
+    PDFs up to 4 MB are first read locally via pypdf; if any page has no text or
+    the total is under min_local_chars characters (scanned PDF), Textract (async)
+    is used instead.
+    Polls until the job completes (no SNS required), backing off exponentially
+    from initial_poll_interval up to poll_interval between status checks.
     """
+    s3 = get_client("s3", region_name)
+    if content_length is None:
+        content_length = s3.head_object(Bucket=bucket, Key=key)["ContentLength"]
+    if content_length <= _MAX_LOCAL_PDF_BYTES:
+        pdf_bytes = s3.get_object(Bucket=bucket, Key=key)["Body"].read()
+        text = _extract_text_local_pdf(pdf_bytes)
+        if len(text.strip()) >= min_local_chars:
+            return text
+
     client = _textract_client(region_name=region_name)
     start = client.start_document_text_detection(
         DocumentLocation={"S3Object": {"Bucket": bucket, "Name": key}}
     )
     job_id = start["JobId"]
 
-    deadline = time.monotonic() + poll_timeout
-    while time.monotonic() < deadline:
+    for delay in _poll_delays(initial_poll_interval, poll_interval, poll_timeout):
         result = client.get_document_text_detection(JobId=job_id)
-        status = result["JobStatus"]
-
-        if status == "SUCCEEDED":
-            blocks = result.get("Blocks", [])
-            while result.get("NextToken"):
-                result = client.get_document_text_detection(
-                    JobId=job_id, NextToken=result["NextToken"]
-                )
-                blocks.extend(result.get("Blocks", []))
-            return _blocks_to_text(blocks)
-        if status == "FAILED":
-            raise RuntimeError(
-                f"Textract job {job_id} failed: {result.get('StatusMessage', 'unknown')}"
+        if _job_succeeded(result, job_id):
+            return _join_page_texts(
+                _blocks_to_text(b) for b in _iter_result_pages(client, job_id, result)
             )
-
-        time.sleep(poll_interval)
+        time.sleep(delay)
 
     raise TimeoutError(f"Textract job {job_id} did not complete within {poll_timeout}s")
 
 
+def _docx_run_text(run: ET.Element, parts: list[str]) -> None:
+    """Append the text of a w:r to parts, like python-docx Run.text."""
+    for child in run:
+        tag = child.tag
+        if tag == f"{_W}t":
+            parts.append(child.text or "")
+        elif tag in (f"{_W}tab", f"{_W}ptab"):
+            parts.append("\t")
+        elif tag == f"{_W}br":
+            # Page and column breaks add nothing; only line breaks become "\n".
+            if child.get(f"{_W}type", "textWrapping") == "textWrapping":
+                parts.append("\n")
+        elif tag == f"{_W}cr":
+            parts.append("\n")
+        elif tag == f"{_W}noBreakHyphen":
+            parts.append("-")
+
+
+def _docx_paragraph_text(p: ET.Element, parts: list[str]) -> None:
+    """
+    Append the text of a w:p to parts, like python-docx Paragraph.text: only runs
+    that are direct children or inside w:hyperlink. Runs in tracked changes
+    (w:ins, w:moveFrom, w:moveTo), content controls (w:sdt), text boxes and
+    drawings are skipped, as python-docx does.
+    """
+    for child in p:
+        if child.tag == f"{_W}r":
+            _docx_run_text(child, parts)
+        elif child.tag == f"{_W}hyperlink":
+            for run in child.iterfind(f"{_W}r"):
+                _docx_run_text(run, parts)
+
+
+def _extract_text_docx_xml(path: str) -> str:
+    """Body paragraphs straight from word/document.xml, without building python-docx objects."""
+    with zipfile.ZipFile(path) as z, z.open("word/document.xml") as f:
+        root = ET.parse(f).getroot()
+    body = root.find(f"{_W}body")
+    if body is None:
+        return ""
+    paragraphs = []
+    for p in body.iterfind(f"{_W}p"):
+        parts: list[str] = []
+        _docx_paragraph_text(p, parts)
+        text = "".join(parts)
+        if text.strip():
+            paragraphs.append(text)
+    return "\n".join(paragraphs)
+
+
 def extract_text_from_docx(path: str) -> str:
     """
-    Extract text from a .docx file using python-docx.
+    Extract text from a .docx file by parsing word/document.xml directly;
+    falls back to python-docx if the package layout is unexpected.
     AWS has no managed Word-to-text API; this runs in your Lambda/ECS.
     """
+    try:
+        return _extract_text_docx_xml(path)
+    except (KeyError, zipfile.BadZipFile, ET.ParseError):
+        pass
+
     from docx import Document as DocxDocument
 
     doc = DocxDocument(path)
     return "\n".join(p.text for p in doc.paragraphs if p.text.strip())
 
 
+def _s3_pdf_head(source: str, region_name: Optional[str]) -> Optional[dict]:
+    """HeadObject response for an s3://....pdf source; None for anything else."""
+    if not _is_s3_uri(source):
+        return None
+    match = _S3_URI_RE.match(source)
+    if not match or not match.group(2).lower().endswith(".pdf"):
+        return None
+    bucket, key = match.groups()
+    return get_client("s3", region_name).head_object(Bucket=bucket, Key=key)
+
+
+def _extraction_cache_key(source: str, s3_head: Optional[dict]) -> Optional[str]:
+    """
+    Content key for PDF/.docx sources (S3: ETag from s3_head; local: SHA-256 of
+    the file). None for plain text, which is as cheap to re-read as to look up.
+    """
+    if _is_s3_uri(source):
+        if s3_head is None:
+            return None
+        bucket, key = _S3_URI_RE.match(source).groups()
+        return cache_key("s3", bucket, key, s3_head["ETag"])
+    path = Path(source)
+    suffix = path.suffix.lower()
+    if suffix not in (".pdf", ".docx"):
+        return None
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        while chunk := f.read(_READ_CHUNK_BYTES):
+            digest.update(chunk)
+    return cache_key("file", suffix, digest.hexdigest())
+
+
 def extract_text_for_summary(
     source: str,
     *,
@@ -102,24 +330,51 @@ def extract_text_for_summary(
     """
     Extract plain text from a file path or S3 URI for summarization.
 
-    - s3://... .pdf → Textract (async, multi-page).
-    - Local .pdf → Textract (sync, single-page).
-    - Local .docx → python-docx.
+    - s3://... .pdf → pypdf, else Textract (async, multi-page).
+    - Local .pdf → pypdf, else Textract (sync, single-page).
+    - Local .docx → word/document.xml parse (python-docx fallback).
     - Anything else → read as UTF-8 text.
+
+    PDF and .docx results are cached by content when DOCUMENT_SUMMARIZER_CACHE_DIR is set.
     """
     source = source.strip()
-    is_s3 = source.lower().startswith("s3://")
+    cache = get_default_cache()
+    s3_head = _s3_pdf_head(source, region_name) if cache else None
+    key = _extraction_cache_key(source, s3_head) if cache else None
+    if key:
+        cached = cache.get("extract", key)
+        if cached is not None:
+            return cached
+    text = _extract_text(
+        source,
+        region_name=region_name,
+        content_length=s3_head["ContentLength"] if s3_head else None,
+    )
+    if key:
+        cache.put("extract", key, text)
+    return text
+
+
+def _extract_text(
+    source: str,
+    *,
+    region_name: Optional[str] = None,
+    content_length: Optional[int] = None,
+) -> str:
+    is_s3 = _is_s3_uri(source)
 
     if is_s3:
-        match = re.match(r"^s3://([^/]+)/(.+)$", source)
+        match = _S3_URI_RE.match(source)
         if not match:
             raise ValueError(f"Invalid S3 URI: {source}")
         bucket, key = match.groups()
         key_lower = key.lower()
         if key_lower.endswith(".pdf"):
-            return extract_text_from_pdf_s3(bucket, key, region_name=region_name)
+            return extract_text_from_pdf_s3(
+                bucket, key, region_name=region_name, content_length=content_length
+            )
         # Text file in S3
-        s3 = boto3.client("s3", region_name=region_name)
+        s3 = get_client("s3", region_name)
         resp = s3.get_object(Bucket=bucket, Key=key)
         return resp["Body"].read().decode("utf-8", errors="replace")
 
@@ -0,0 +1,90 @@
+"""
+Async Textract extraction for S3 PDFs using aiobotocore (optional dependency).
+
+Polling sleeps yield to the event loop, so many jobs can poll concurrently on
+one thread. Kept out of extract.py so synchronous callers don't import asyncio.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Optional
+
+from .extract import _blocks_to_text, _job_succeeded, _join_page_texts, _poll_delays
+
+
+async def extract_text_from_pdf_s3_async(
+    bucket: str,
+    key: str,
+    *,
+    region_name: Optional[str] = None,
+    poll_interval: float = 2.0,
+    poll_timeout: float = 300.0,
+    initial_poll_interval: float = 0.25,
+    client=None,
+) -> str:
+    """
+    Async variant of extract_text_from_pdf_s3(). Always uses Textract (no pypdf
+    fast path, which would block the loop). Pass an aiobotocore Textract `client`
+    to share one across jobs; otherwise one is created for this call.
+    """
+    if client is None:
+        from aiobotocore.session import get_session
+
+        async with get_session().create_client("textract", region_name=region_name) as client:
+            return await extract_text_from_pdf_s3_async(
+                bucket,
+                key,
+                poll_interval=poll_interval,
+                poll_timeout=poll_timeout,
+                initial_poll_interval=initial_poll_interval,
+                client=client,
+            )
+
+    start = await client.start_document_text_detection(
+        DocumentLocation={"S3Object": {"Bucket": bucket, "Name": key}}
+    )
+    job_id = start["JobId"]
+
+    for delay in _poll_delays(initial_poll_interval, poll_interval, poll_timeout):
+        result = await client.get_document_text_detection(JobId=job_id)
+        if _job_succeeded(result, job_id):
+            page_texts = [_blocks_to_text(result.get("Blocks", []))]
+            while result.get("NextToken"):
+                result = await client.get_document_text_detection(
+                    JobId=job_id, NextToken=result["NextToken"]
+                )
+                page_texts.append(_blocks_to_text(result.get("Blocks", [])))
+            return _join_page_texts(page_texts)
+        await asyncio.sleep(delay)
+
+    raise TimeoutError(f"Textract job {job_id} did not complete within {poll_timeout}s")
+
+
+async def extract_texts_from_pdfs_s3_async(
+    locations: list[tuple[str, str]],
+    *,
+    region_name: Optional[str] = None,
+    max_concurrency: int = 50,
+    **kwargs,
+) -> list[str]:
+    """
+    Extract text from many (bucket, key) PDFs in S3 concurrently with one shared
+    aiobotocore client; at most max_concurrency Textract jobs run at once.
+    Results are returned in the order of `locations`. Extra kwargs are passed
+    to extract_text_from_pdf_s3_async().
+    """
+    from aiobotocore.config import AioConfig
+    from aiobotocore.session import get_session
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+    config = AioConfig(max_pool_connections=max_concurrency)
+    async with get_session().create_client(
+        "textract", region_name=region_name, config=config
+    ) as client:
+
+        async def extract_one(bucket: str, key: str) -> str:
+            async with semaphore:
+                return await extract_text_from_pdf_s3_async(bucket, key, client=client, **kwargs)
+
+        return list(await asyncio.gather(*(extract_one(b, k) for b, k in locations)))
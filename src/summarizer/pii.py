@@ -1,7 +1,8 @@
 """
 PII and sensitive-document handling using Amazon Comprehend.
 
-- Detect PII: DetectPiiEntities (chunked for long text; 5 KB limit per request).
+- Detect PII: ContainsPiiEntities (yes/no) or DetectPiiEntities (spans); chunked
+  by UTF-8 size for long text (5 KB limit per request).
 - Redact: Replace detected PII spans with a mask before sending to Bedrock.
 - Block: Optionally refuse to process when PII is detected.
 
@@ -11,52 +12,171 @@ the VPC endpoint (no NAT).
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import chain
 from typing import Optional
 
-import boto3
+from .clients import get_client
 
-# Comprehend sync API limit is 5000 bytes per request; chunk to stay under.
-_CHUNK_CHARS = 4000
+# Comprehend sync API limit is 5000 bytes (UTF-8) per request; chunk to stay under.
+_CHUNK_BYTES = 4900
+# Upper bound on concurrent Comprehend calls per document (within the client's pool).
+# Comprehend has no batch PII API (BatchDetect* covers entities, key phrases, etc.
+# but not PII), so chunks are fanned out as concurrent single-document calls.
+_MAX_WORKERS = 32
 
 
 def _comprehend_client(region_name: Optional[str] = None):
-    return boto3.client("comprehend", region_name=region_name)
+    return get_client("comprehend", region_name)
 
 
-def _chunk_text_simple(text: str, max_chars: int = _CHUNK_CHARS) -> list[tuple[str, int]]:
-    """Split by character count (safe under 5KB for ASCII; may be under for UTF-8)."""
+def _chunk_text_simple(text: str, max_bytes: int = _CHUNK_BYTES) -> list[tuple[str, int]]:
+    """
+    Split into chunks of at most max_bytes UTF-8 bytes, never inside a code point.
+    Returns (chunk, char_offset) pairs; Comprehend offsets are in code points,
+    so char_offset maps them back to positions in `text`.
+    """
+    if max_bytes < 4:
+        # A UTF-8 code point can take 4 bytes; smaller chunks could never hold it.
+        raise ValueError(f"max_bytes must be at least 4, got {max_bytes}")
+    data = text.encode("utf-8")
     result: list[tuple[str, int]] = []
-    for i in range(0, len(text), max_chars):
-        chunk = text[i : i + max_chars]
-        result.append((chunk, i))
+    char_offset = 0
+    i = 0
+    while i < len(data):
+        j = min(i + max_bytes, len(data))
+        # Back off to the start of a code point (UTF-8 continuation bytes are 10xxxxxx).
+        while j < len(data) and data[j] & 0xC0 == 0x80:
+            j -= 1
+        chunk = data[i:j].decode("utf-8")
+        result.append((chunk, char_offset))
+        char_offset += len(chunk)
+        i = j
     return result
 
 
+def _chunk_has_pii(client, chunk: str, language_code: str, threshold: float) -> bool:
+    try:
+        resp = client.contains_pii_entities(Text=chunk, LanguageCode=language_code)
+    except Exception:
+        # If we can't call Comprehend, treat as "might have PII" and report True to be safe
+        return True
+    return any(label["Score"] >= threshold for label in resp.get("Labels", []))
+
+
 def contains_pii(
     text: str,
     *,
     region_name: Optional[str] = None,
     language_code: str = "en",
+    threshold: float = 0.5,
 ) -> bool:
     """
-    Return True if the text contains detected PII (Comprehend DetectPiiEntities).
-    Chunks long text to respect the 5 KB per-request limit.
+    Return True if the text contains detected PII (Comprehend ContainsPiiEntities).
+    A PII label counts when its confidence score is at least `threshold`.
+    Chunks long text to respect the 5 KB per-request limit; chunks are checked concurrently.
     """
     if not text or not text.strip():
         return False
+    chunks = [c for c, _ in _chunk_text_simple(text) if c.strip()]
+    if not chunks:
+        return False
+    client = _comprehend_client(region_name=region_name)
+    if len(chunks) == 1:
+        # Short text: a single call on this thread, no executor.
+        return _chunk_has_pii(client, chunks[0], language_code, threshold)
+    executor = ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(chunks)))
+    futures = [
+        executor.submit(_chunk_has_pii, client, chunk, language_code, threshold)
+        for chunk in chunks
+    ]
+    try:
+        return any(future.result() for future in as_completed(futures))
+    finally:
+        # Short-circuit: drop chunks that have not been sent yet.
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+def _chunk_pii_ranges(
+    client, chunk: str, char_offset: int, language_code: str
+) -> list[tuple[int, int]]:
+    """PII (start, end) ranges for one chunk, sorted, in whole-text coordinates."""
+    try:
+        resp = client.detect_pii_entities(Text=chunk, LanguageCode=language_code)
+    except Exception as e:
+        # Fail closed: do not send potentially unredacted PII to Bedrock
+        raise RuntimeError(
+            "PII redaction failed (Comprehend error); document not sent to Bedrock."
+        ) from e
+    ranges = [
+        (char_offset + ent["BeginOffset"], char_offset + ent["EndOffset"])
+        for ent in resp.get("Entities", [])
+    ]
+    # Comprehend returns entities in offset order, so this is a linear check in practice.
+    ranges.sort()
+    return ranges
+
+
+def _scan_pii(
+    text: str,
+    *,
+    region_name: Optional[str] = None,
+    language_code: str = "en",
+) -> tuple[bool, list[tuple[int, int]]]:
+    """
+    Run DetectPiiEntities over all chunks of `text` (concurrently) and return
+    (found, ranges): merged, sorted (start, end) character ranges in `text`.
+    Raises RuntimeError if any Comprehend call fails (fail closed).
+    """
+    chunks = [(c, off) for c, off in _chunk_text_simple(text) if c.strip()]
+    if not chunks:
+        return False, []
     client = _comprehend_client(region_name=region_name)
-    chunks = _chunk_text_simple(text)
-    for chunk, _ in chunks:
-        if not chunk.strip():
-            continue
-        try:
-            resp = client.detect_pii_entities(Text=chunk, LanguageCode=language_code)
-            if resp.get("Entities"):
-                return True
-        except Exception:
-            # If we can't call Comprehend, treat as "might have PII" and report True to be safe
-            return True
-    return False
+    # Per-chunk (start, end) ranges to redact (in original text coordinates), in chunk order.
+    if len(chunks) == 1:
+        # Short text: a single call on this thread, no executor.
+        chunk, char_offset = chunks[0]
+        per_chunk = [_chunk_pii_ranges(client, chunk, char_offset, language_code)]
+    else:
+        with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(chunks))) as executor:
+            futures = [
+                executor.submit(_chunk_pii_ranges, client, chunk, char_offset, language_code)
+                for chunk, char_offset in chunks
+            ]
+            try:
+                # Surface the first failure as soon as it happens, whatever the chunk order.
+                for future in as_completed(futures):
+                    future.result()
+            except RuntimeError:
+                for f in futures:
+                    f.cancel()
+                raise
+        per_chunk = [future.result() for future in futures]
+    # Chunks are disjoint and in offset order, and each chunk's ranges are sorted, so
+    # concatenating them is already sorted: merge overlapping ranges in one pass.
+    merged: list[tuple[int, int]] = []
+    for s, e in chain.from_iterable(per_chunk):
+        if merged and s <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], e))
+        else:
+            merged.append((s, e))
+    return bool(merged), merged
+
+
+def _apply_redactions(text: str, ranges: list[tuple[int, int]], mask: str) -> str:
+    """Replace each (start, end) range (sorted, non-overlapping) with `mask` in one forward pass."""
+    if not ranges:
+        return text
+    out: list[str] = []
+    prev = 0
+    for start, end in ranges:
+        out.append(text[prev:start])
+        out.append(mask)
+        prev = end
+    out.append(text[prev:])
+    return "".join(out)
 
 
 def redact_pii(
@@ -68,39 +188,11 @@ def redact_pii(
 ) -> str:
     """
     Replace detected PII with a mask so it is not sent to Bedrock.
-    Uses Comprehend DetectPiiEntities; chunks long text (5 KB limit per request).
+    Uses Comprehend DetectPiiEntities; chunks long text (5 KB limit per request)
+    and sends the chunks concurrently.
     Returns the redacted string (same length pattern not preserved; spans replaced by mask).
     """
     if not text or not text.strip():
         return text
-    client = _comprehend_client(region_name=region_name)
-    chunks = _chunk_text_simple(text)
-    # Build list of (start, end) character ranges to redact (in original text coordinates).
-    redact_ranges: list[tuple[int, int]] = []
-    for chunk, char_offset in chunks:
-        if not chunk.strip():
-            continue
-        try:
-            resp = client.detect_pii_entities(Text=chunk, LanguageCode=language_code)
-            for ent in resp.get("Entities", []):
-                start = char_offset + ent["BeginOffset"]
-                end = char_offset + ent["EndOffset"]
-                redact_ranges.append((start, end))
-        except Exception as e:
-            # Fail closed: do not send potentially unredacted PII to Bedrock
-            raise RuntimeError(
-                "PII redaction failed (Comprehend error); document not sent to Bedrock."
-            ) from e
-    # Sort by start and merge overlapping/adjacent ranges.
-    redact_ranges.sort(key=lambda r: r[0])
-    merged: list[tuple[int, int]] = []
-    for s, e in redact_ranges:
-        if merged and s <= merged[-1][1]:
-            merged[-1] = (merged[-1][0], max(merged[-1][1], e))
-        else:
-            merged.append((s, e))
-    # Apply redactions from end to start so indices don't shift.
-    result = list(text)  # work with list for mutable updates
-    for start, end in reversed(merged):
-        result[start:end] = list(mask)
-    return "".join(result)
+    _, ranges = _scan_pii(text, region_name=region_name, language_code=language_code)
+    return _apply_redactions(text, ranges, mask)
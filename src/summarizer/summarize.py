@@ -4,19 +4,21 @@ Document summarization using Amazon Bedrock.
 When run in a VPC with the Terraform-created VPC endpoints and IAM role,
 the AWS SDK uses PrivateLink automatically (no code changes needed).
 
-Supports: plain text, PDF (via Amazon Textract), and Word .docx (via python-docx).
+Supports: plain text, PDF (via pypdf, or Amazon Textract for scanned PDFs), and
+Word .docx (parsed directly from its XML).
 """
 
 from __future__ import annotations
 
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
-import boto3
-
-from .extract import extract_text_for_summary
+from .cache import cache_key, get_default_cache
+from .clients import get_client
+from .extract import _is_s3_uri, extract_text_for_summary
 from .log_config import audit_log
-from .pii import contains_pii, redact_pii
+from .pii import _apply_redactions, _scan_pii, contains_pii
 
 # Valid values for pii_mode (compliance logging and validation)
 PII_MODE_REDACT = "redact"
@@ -34,9 +36,28 @@ class PIIDetectedError(Exception):
 # Default model; override with BEDROCK_MODEL_ID env or parameter.
 DEFAULT_MODEL_ID = "anthropic.claude-3-5-sonnet-20241022-v2:0"
 
+# Sent as its own content block ahead of the document, so the document text is
+# never copied into a larger prompt string.
+PROMPT_PREAMBLE = (
+    "Summarize the following document concisely. "
+    "Preserve key facts and conclusions. "
+    "Do not add commentary or meta text."
+)
+SYSTEM_PROMPT = "You are a document summarization assistant. Output only the summary, no preamble."
+
+# Bump when the prompt or system text changes so cached summaries are not reused.
+_PROMPT_VERSION = "2"
+
 
 def _get_client(region_name: Optional[str] = None):
-    return boto3.client("bedrock-runtime", region_name=region_name)
+    return get_client("bedrock-runtime", region_name)
+
+
+def _warm_clients(region_name: Optional[str], pii_mode: str) -> None:
+    """Build (and cache) the clients summarize_text will need while extraction runs."""
+    _get_client(region_name=region_name)
+    if pii_mode != PII_MODE_OFF:
+        get_client("comprehend", region_name)
 
 
 def summarize_text(
@@ -57,6 +78,7 @@ def summarize_text(
     pii_mode: "redact" (default) = replace PII with a mask before sending to Bedrock;
       "block" = raise PIIDetectedError if PII is found and do not call Bedrock;
       "off" = do not check or redact PII.
+    Summaries are cached by input text and settings when DOCUMENT_SUMMARIZER_CACHE_DIR is set.
     Uses the Converse API. When running in the VPC with the document-summarizer
     Terraform stack, the default boto3 client uses the VPC endpoints and
     the task/instance role (no credentials needed).
@@ -71,7 +93,34 @@ def summarize_text(
         return ""
 
     start = time.perf_counter()
+    cache = get_default_cache()
+    summary_key = None
     try:
+        if cache:
+            summary_key = cache_key(
+                _PROMPT_VERSION,
+                text,
+                model_id,
+                str(max_tokens),
+                repr(temperature),
+                pii_mode,
+                pii_language_code,
+                pii_mask,
+            )
+            cached = cache.get("summary", summary_key)
+            if cached is not None:
+                duration_ms = round((time.perf_counter() - start) * 1000)
+                audit_log.audit(
+                    "summarize_success",
+                    action="summarize_text",
+                    source_type=_audit_source_type,
+                    pii_mode=pii_mode,
+                    duration_ms=duration_ms,
+                    status="success",
+                    cache_hit=True,
+                )
+                return cached
+
         if pii_mode == PII_MODE_BLOCK:
             if contains_pii(text, region_name=region_name, language_code=pii_language_code):
                 duration_ms = round((time.perf_counter() - start) * 1000)
@@ -88,31 +137,22 @@ def summarize_text(
                     "Document contains PII; summarization blocked. Use pii_mode='redact' to summarize with PII masked."
                 )
         elif pii_mode == PII_MODE_REDACT:
-            text = redact_pii(
-                text,
-                region_name=region_name,
-                language_code=pii_language_code,
-                mask=pii_mask,
+            # One DetectPiiEntities pass; the text is only rebuilt if spans were found.
+            pii_found, pii_ranges = _scan_pii(
+                text, region_name=region_name, language_code=pii_language_code
             )
+            if pii_found:
+                text = _apply_redactions(text, pii_ranges, pii_mask)
 
         response = client.converse(
             modelId=model_id,
             messages=[
                 {
                     "role": "user",
-                    "content": [
-                        {
-                            "text": (
-                                "Summarize the following document concisely. "
-                                "Preserve key facts and conclusions. "
-                                "Do not add commentary or meta text.\n\n"
-                                f"{text}"
-                            )
-                        }
-                    ],
+                    "content": [{"text": PROMPT_PREAMBLE}, {"text": text}],
                 }
             ],
-            system=[{"text": "You are a document summarization assistant. Output only the summary, no preamble."}],
+            system=[{"text": SYSTEM_PROMPT}],
             inferenceConfig={
                 "maxTokens": max_tokens,
                 "temperature": temperature,
@@ -124,6 +164,8 @@ def summarize_text(
         message = output.get("message", {})
         parts = message.get("content", [])
         summary = "".join(block.get("text", "") for block in parts if block.get("text"))
+        if summary_key:
+            cache.put("summary", summary_key, summary)
         duration_ms = round((time.perf_counter() - start) * 1000)
         audit_log.audit(
             "summarize_success",
@@ -164,8 +206,9 @@ def summarize_document(
     """
     Summarize a document from a local file path or S3 URI.
 
-    - PDF: extracted via Amazon Textract (single-page local, multi-page from S3).
-    - Word .docx: extracted via python-docx. (.doc not supported.)
+    - PDF: text layer read via pypdf; scanned PDFs via Amazon Textract
+      (single-page local, multi-page from S3).
+    - Word .docx: extracted from word/document.xml (python-docx fallback). (.doc not supported.)
     - Other: read as UTF-8 text (.txt, .md, .json, .html, etc.).
 
     PII: pii_mode "redact" (default) masks PII before sending to Bedrock;
@@ -177,8 +220,16 @@ def summarize_document(
     if pii_mode not in PII_MODES:
         raise ValueError(f"pii_mode must be one of {PII_MODES!r}, got {pii_mode!r}")
 
-    source_type = "s3" if source.strip().lower().startswith("s3://") else "file"
-    text = extract_text_for_summary(source, region_name=region_name)
+    source_type = "s3" if _is_s3_uri(source.strip()) else "file"
+    # Client builds share the session lock, so build the S3 client extraction calls first;
+    # the Bedrock/Comprehend builds then overlap extraction instead of delaying its start.
+    # Textract is built lazily by extraction, only if a PDF needs it.
+    # A warm-up failure is ignored here; summarize_text surfaces it with an audit event.
+    if source_type == "s3":
+        get_client("s3", region_name)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        executor.submit(_warm_clients, region_name, pii_mode)
+        text = extract_text_for_summary(source, region_name=region_name)
 
     return summarize_text(
         text,
@@ -275,7 +275,7 @@ data "aws_iam_policy_document" "summarizer_bedrock_s3" {
   statement {
     sid       = "ComprehendPII"
     effect    = "Allow"
-    actions   = ["comprehend:DetectPiiEntities"]
+    actions   = ["comprehend:DetectPiiEntities", "comprehend:ContainsPiiEntities"]
     resources = ["*"]
   }
 